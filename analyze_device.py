@@ -3,50 +3,70 @@
 Analyze the ifm AL1350 web interface to understand available endpoints
 """
 
-import requests
 import re
 
+# Shared session with keep-alive so repeated probes reuse one TCP
+# connection. Created lazily so importing requests (and its urllib3/
+# certifi chain) is deferred until a request is actually made.
+_SESSION = None
+
+
+def get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+    return _SESSION
+
+# Single combined pattern for JavaScript/API endpoint discovery, compiled
+# once at import. One alternation walks the HTML buffer a single time
+# instead of one full pass per pattern; the named group that matched
+# tells us which kind of clue was found.
+_JS_RX = re.compile(
+    r"(?P<fetch>fetch\s*\(\s*['\"][^'\"]+['\"])"
+    r"|(?P<xhr>XMLHttpRequest.*?open\s*\(\s*['\"][^'\"]*['\"]\s*,\s*['\"][^'\"]+['\"])"
+    r"|(?P<ajax>ajax\s*\(\s*['\"][^'\"]+['\"])"
+    r"|(?P<api>/api/[^\"'>\s]+)"
+    r"|(?P<iolinkmaster>/iolinkmaster/[^\"'>\s]+)"
+    r"|(?P<href>href\s*=\s*['\"][^'\"]*api[^'\"]*['\"])"
+    r"|(?P<action>action\s*=\s*['\"][^'\"]*['\"])",
+    re.IGNORECASE,
+)
+
+_ENDPOINT_KEYWORDS = ("iolinkmaster", "api", "data", "port", "sensor", "temperature")
+
 
 def analyze_web_interface(url):
     """Analyze the web interface HTML for clues about API endpoints"""
     try:
-        response = requests.get(url, timeout=5)
+        response = get_session().get(url, timeout=5)
         if response.status_code == 200:
             print(f"✅ Web interface accessible")
             print(f"📄 Content length: {len(response.text)} characters")
 
-            # Look for JavaScript that might reveal API endpoints
-            js_patterns = [
-                r'fetch\s*\(\s*["\']([^"\']+)["\']',
-                r'XMLHttpRequest.*?open\s*\(\s*["\'][^"\']*["\'],\s*["\']([^"\']+)["\']',
-                r'ajax\s*\(\s*["\']([^"\']+)["\']',
-                r'/api/[^"\'>\s]+',
-                r'/iolinkmaster/[^"\'>\s]+',
-                r'href\s*=\s*["\']([^"\']*api[^"\']*)["\']',
-                r'action\s*=\s*["\']([^"\']*)["\']',
-            ]
-
             content = response.text
             print(f"\n🔍 Searching for API endpoints in HTML...")
 
-            for pattern in js_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    print(f"📍 Pattern '{pattern}' found:")
-                    for match in matches:
-                        print(f"   {match}")
+            # Look for JavaScript that might reveal API endpoints
+            for match in _JS_RX.finditer(content):
+                print(f"📍 {match.lastgroup}: {match.group(0)}")
 
             # Look for any references to endpoints
-            endpoint_keywords = [
-                "iolinkmaster",
-                "api",
-                "data",
-                "port",
-                "sensor",
-                "temperature",
-            ]
-            for keyword in endpoint_keywords:
-                if keyword in content.lower():
+            # (lowercase once instead of re-scanning the buffer per keyword)
+            content_lower = content.lower()
+            for keyword in _ENDPOINT_KEYWORDS:
+                if keyword in content_lower:
                     print(f"🔑 Found keyword '{keyword}' in HTML")
 
             # Print first 500 chars to see structure
@@ -63,26 +83,70 @@ def analyze_web_interface(url):
         return False
 
 
-def test_mqtt_or_websocket(device_ip):
-    """Check if device supports MQTT or WebSocket connections"""
+def probe_tcp(targets, timeout=0.5):
+    """
+    Probe several (ip, port) targets at once with non-blocking connects
+
+    All connects are started immediately and completions collected with a
+    selector, so N probes finish within one timeout window on one thread.
+
+    Returns:
+        dict: Mapping of (ip, port) to True if the port is open
+    """
+    import selectors
     import socket
+    import time
 
-    mqtt_port = 1883
-    websocket_port = 80
+    results = {target: False for target in targets}
+    sel = selectors.DefaultSelector()
+    socks = []
 
-    print(f"\n🔍 Testing MQTT connection on port {mqtt_port}...")
-    try:
+    for target in targets:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((device_ip, mqtt_port))
+        sock.setblocking(False)
+        try:
+            sock.connect(target)
+        except BlockingIOError:
+            pass
+        except OSError:
+            sock.close()
+            continue
+        sel.register(sock, selectors.EVENT_WRITE, target)
+        socks.append(sock)
+
+    # Collect connect results until all answered or the window expires;
+    # SO_ERROR distinguishes an accepted connect from a refused one
+    deadline = time.monotonic() + timeout
+    pending = len(socks)
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for key, _ in sel.select(remaining):
+            error = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            results[key.data] = error == 0
+            sel.unregister(key.fileobj)
+            pending -= 1
+
+    for sock in socks:
         sock.close()
+    sel.close()
+
+    return results
+
+
+def test_mqtt_or_websocket(device_ip):
+    """Check if device supports MQTT or WebSocket connections"""
+    probes = {"MQTT": 1883, "WebSocket/HTTP": 80}
 
-        if result == 0:
-            print(f"✅ MQTT port {mqtt_port} is open")
+    print(f"\n🔍 Testing {', '.join(probes)} ports...")
+    results = probe_tcp([(device_ip, port) for port in probes.values()])
+
+    for name, port in probes.items():
+        if results.get((device_ip, port)):
+            print(f"✅ {name} port {port} is open")
         else:
-            print(f"❌ MQTT port {mqtt_port} is closed")
-    except Exception as e:
-        print(f"❌ MQTT test failed: {e}")
+            print(f"❌ {name} port {port} is closed")
 
 
 def main():
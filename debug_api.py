@@ -5,6 +5,25 @@ Debug script to test ifm AL1350 API endpoints
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session with keep-alive so repeated probes reuse one TCP connection
+# instead of paying the connect/handshake cost on every request
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+SESSION.headers.update({"Content-Type": "application/json", "Connection": "keep-alive"})
+
+# (connect, read) timeouts: the device answers valid probes in well under
+# a second, so a short read budget makes the negative path fail fast
+TIMEOUT = (1.0, 0.5)
 
 
 def test_endpoint(url, endpoint, cid=1):
@@ -13,9 +32,7 @@ def test_endpoint(url, endpoint, cid=1):
 
     try:
         print(f"\n🔍 Testing endpoint: {endpoint}")
-        response = requests.post(
-            url, json=payload, headers={"Content-Type": "application/json"}, timeout=5
-        )
+        response = SESSION.post(url, json=payload, timeout=TIMEOUT)
 
         if response.status_code == 200:
             data = response.json()
@@ -30,32 +47,87 @@ def test_endpoint(url, endpoint, cid=1):
         return None
 
 
+def test_endpoints_batched(url, endpoints):
+    """
+    Probe all endpoints in a single POST
+
+    The ifm JSON protocol accepts an array of request objects (same
+    {code, cid, adr} schema wrapped in a list), so all probes can share
+    one HTTP round-trip. Falls back to per-endpoint requests if the
+    device does not return a list.
+
+    Returns:
+        dict: Mapping of endpoint to response dict (None on failure)
+    """
+    payload = [
+        {"code": "request", "cid": cid, "adr": endpoint}
+        for cid, endpoint in enumerate(endpoints)
+    ]
+
+    try:
+        print(f"\n🔍 Testing {len(endpoints)} endpoints in one batched request...")
+        response = SESSION.post(url, json=payload, timeout=TIMEOUT)
+
+        if response.status_code == 200:
+            data = response.json()
+            if isinstance(data, list):
+                # Pair responses back to endpoints by cid
+                by_cid = {item.get("cid"): item for item in data}
+                return {
+                    endpoint: by_cid.get(cid)
+                    for cid, endpoint in enumerate(endpoints)
+                }
+            print("⚠️ Device returned a non-list response, falling back")
+        else:
+            print(f"❌ HTTP Error: {response.status_code}, falling back")
+
+    except Exception as e:
+        print(f"❌ Batched request failed: {e}, falling back")
+
+    # Fallback: probe each endpoint individually
+    return {endpoint: test_endpoint(url, endpoint) for endpoint in endpoints}
+
+
 def main():
     device_ip = "192.168.1.101"
     base_url = f"http://{device_ip}"
 
     print(f"🔗 Testing API endpoints for {device_ip}")
 
-    # Test various endpoint variations
-    endpoints_to_test = [
-        "/iolinkmaster/port/numberofports/getdata",
-        "/port/numberofports/getdata",
-        "/iolinkmaster/numberofports/getdata",
-        "/numberofports/getdata",
-        "/api/iolinkmaster/port/numberofports/getdata",
-        "/getdata/iolinkmaster/port/numberofports",
-        "/iolinkmaster/port/count",
-        "/iolinkmaster/ports",
-        "/iolinkmaster/info",
-        "/iolinkmaster/status",
-        "/iolinkmaster",
-        "/api",
-        "/info",
-        "/status",
-    ]
+    # Endpoint variations to probe, documented ifm endpoint first so the
+    # common case is answered by a single request. Deduplicated while
+    # preserving order.
+    endpoints_to_test = list(
+        dict.fromkeys(
+            [
+                "/iolinkmaster/port/numberofports/getdata",
+                "/port/numberofports/getdata",
+                "/iolinkmaster/numberofports/getdata",
+                "/numberofports/getdata",
+                "/api/iolinkmaster/port/numberofports/getdata",
+                "/getdata/iolinkmaster/port/numberofports",
+                "/iolinkmaster/port/count",
+                "/iolinkmaster/ports",
+                "/iolinkmaster/info",
+                "/iolinkmaster/status",
+                "/iolinkmaster",
+                "/api",
+                "/info",
+                "/status",
+            ]
+        )
+    )
+
+    # Fast path: if the canonical endpoint answers with data, we're done
+    result = test_endpoint(base_url, endpoints_to_test[0])
+    if result and result.get("code") == 200 and "data" in result:
+        print(f"🎯 WORKING ENDPOINT FOUND: {endpoints_to_test[0]}")
+        return
+
+    # Exhaustive fallback: batch the remaining probes in one request
+    results = test_endpoints_batched(base_url, endpoints_to_test[1:])
 
-    for endpoint in endpoints_to_test:
-        result = test_endpoint(base_url, endpoint)
+    for endpoint, result in results.items():
         if result and result.get("code") != 404:
             print(f"🎯 WORKING ENDPOINT FOUND: {endpoint}")
 
@@ -18,8 +18,6 @@ import os
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from iolink_master import IOLinkMaster
-
 
 def quick_scan(ip_address="169.254.178.135"):
     """
@@ -28,6 +26,10 @@ def quick_scan(ip_address="169.254.178.135"):
     Args:
         ip_address (str): IP address of the IO-Link Master
     """
+    # Imported lazily so console-script startup (--help, bad args) does
+    # not pay for the requests import chain
+    from iolink_master import IOLinkMaster
+
     print("=" * 60)
     print("ifm ZZ1350 IO-Link Master - Quick Device Scanner")
     print("=" * 60)
@@ -44,20 +46,34 @@ def quick_scan(ip_address="169.254.178.135"):
             print("❌ No ports detected or connection failed")
             return
 
-        # Scan each port
-        connected_devices = 0
+        # Fetch status, name and process data for all ports in a single
+        # batched POST instead of 3-4 HTTP round-trips per port
+        adrs = []
         for port in range(1, port_count + 1):
-            print(f"\n🔍 Scanning Port {port}...")
+            adrs += [
+                f"/iolinkmaster/port[{port}]/iolinkdevice/status/getdata",
+                f"/iolinkmaster/port[{port}]/iolinkdevice/productname/getdata",
+                f"/iolinkmaster/port[{port}]/iolinkdevice/pdin/getdata",
+            ]
 
-            status = master.get_device_status(port)
+        values = master.batch_request(adrs)
+
+        # Print results in port order
+        connected_devices = 0
+        for port in range(1, port_count + 1):
+            status, name, data = values[(port - 1) * 3 : port * 3]
+            # Some firmware sends the status as a JSON number; normalize
+            # like the library's get_device_status does
+            status = str(status) if status is not None else "0"
+            print(f"\n🔍 Port {port}:")
 
             if status == "2":  # Device connected
                 connected_devices += 1
-                name = master.get_device_name(port)
-                data = master.get_device_data(port)
-                temp = master.get_temperature_celsius(port)
+                # Convert the pdin already fetched in the batch instead
+                # of re-requesting it via get_temperature_celsius
+                temp = master.parse_temperature(data)
 
-                print(f"✅ Device: {name}")
+                print(f"✅ Device: {name or 'Unknown'}")
                 print(f"📊 Current data: {data}")
 
                 if temp is not None:
@@ -24,12 +24,11 @@ Requirements:
 import sys
 import os
 import time
+from collections import deque
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from iolink_master import IOLinkMaster
-
 
 def monitor_temperature_advanced(ip_address="169.254.178.135", port=1, interval=5):
     """
@@ -40,6 +39,10 @@ def monitor_temperature_advanced(ip_address="169.254.178.135", port=1, interval=
         port (int): Port number to monitor
         interval (int): Seconds between readings
     """
+    # Imported lazily so console-script startup (--help, bad args) does
+    # not pay for the requests import chain
+    from iolink_master import IOLinkMaster
+
     print("=" * 60)
     print("ifm ZZ1350 IO-Link Master - Temperature Monitor")
     print("=" * 60)
@@ -60,10 +63,16 @@ def monitor_temperature_advanced(ip_address="169.254.178.135", port=1, interval=
         print(f"⏰ Reading interval: {interval} seconds")
         print("📈 Press Ctrl+C to stop and see statistics\n")
 
-        # Statistics tracking
-        temperatures = []
+        # Statistics tracking over a rolling window with running
+        # aggregates, so each tick costs O(1) instead of rescanning the
+        # full history, and memory stays bounded on long runs
+        temperatures = deque(maxlen=3600)
+        running_sum = 0.0
+        min_temp = None
+        max_temp = None
         start_time = time.time()
         reading_count = 0
+        valid_readings = 0
 
         try:
             while True:
@@ -72,27 +81,51 @@ def monitor_temperature_advanced(ip_address="169.254.178.135", port=1, interval=
                 timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
 
                 if temperature is not None:
+                    valid_readings += 1
+
+                    # Update running aggregates; when the window is full,
+                    # account for the evicted value and only rescan the
+                    # window if the evicted value was the current min/max
+                    evicted = None
+                    if len(temperatures) == temperatures.maxlen:
+                        evicted = temperatures[0]
                     temperatures.append(temperature)
 
-                    # Calculate running statistics
-                    if len(temperatures) > 1:
-                        min_temp = min(temperatures)
-                        max_temp = max(temperatures)
-                        avg_temp = sum(temperatures) / len(temperatures)
+                    running_sum += temperature
+                    if evicted is not None:
+                        running_sum -= evicted
+                        if evicted == min_temp:
+                            min_temp = min(temperatures)
+                        if evicted == max_temp:
+                            max_temp = max(temperatures)
+
+                    if min_temp is None or temperature < min_temp:
+                        min_temp = temperature
+                    if max_temp is None or temperature > max_temp:
+                        max_temp = temperature
 
-                        print(
+                    avg_temp = running_sum / len(temperatures)
+
+                    # Build the whole tick's output and write it in one
+                    # syscall — on slow TTYs the per-line prints can
+                    # otherwise dominate the loop
+                    if len(temperatures) > 1:
+                        out = (
                             f"[{timestamp}] 🌡️ {temperature:.1f}°C | "
                             f"Min: {min_temp:.1f}°C | Max: {max_temp:.1f}°C | "
-                            f"Avg: {avg_temp:.1f}°C"
+                            f"Avg: {avg_temp:.1f}°C\n"
                         )
                     else:
-                        print(f"[{timestamp}] 🌡️ {temperature:.1f}°C")
+                        out = f"[{timestamp}] 🌡️ {temperature:.1f}°C\n"
 
                     # Simple alert system
                     if temperature > 30.0:
-                        print(f"🔥 HIGH TEMPERATURE ALERT: {temperature:.1f}°C")
+                        out += f"🔥 HIGH TEMPERATURE ALERT: {temperature:.1f}°C\n"
                     elif temperature < 10.0:
-                        print(f"🧊 LOW TEMPERATURE ALERT: {temperature:.1f}°C")
+                        out += f"🧊 LOW TEMPERATURE ALERT: {temperature:.1f}°C\n"
+
+                    sys.stdout.write(out)
+                    sys.stdout.flush()
 
                 else:
                     print(f"[{timestamp}] ❌ Failed to read temperature")
@@ -111,11 +144,11 @@ def monitor_temperature_advanced(ip_address="169.254.178.135", port=1, interval=
 
             if temperatures:
                 print(f"🌡️ Temperature Statistics:")
-                print(f"   • Minimum: {min(temperatures):.1f}°C")
-                print(f"   • Maximum: {max(temperatures):.1f}°C")
-                print(f"   • Average: {sum(temperatures)/len(temperatures):.1f}°C")
-                print(f"   • Range: {max(temperatures) - min(temperatures):.1f}°C")
-                print(f"   • Valid readings: {len(temperatures)}/{reading_count}")
+                print(f"   • Minimum: {min_temp:.1f}°C")
+                print(f"   • Maximum: {max_temp:.1f}°C")
+                print(f"   • Average: {running_sum / len(temperatures):.1f}°C")
+                print(f"   • Range: {max_temp - min_temp:.1f}°C")
+                print(f"   • Valid readings: {valid_readings}/{reading_count}")
 
             print("\n🛑 Monitoring stopped by user")
 
@@ -41,7 +41,8 @@ def final_temperature_summary():
 
         if raw_data and temp is not None:
             temp_hex = raw_data[:4]
-            decimal_value = int(temp_hex, 16)
+            # Signed BigEndian 16-bit decode (matches the TV7105 spec range)
+            decimal_value = int.from_bytes(bytes.fromhex(temp_hex), "big", signed=True)
 
             print(f"   📊 Raw data: {raw_data}")
             print(f"   🔢 Temperature hex: 0x{temp_hex}")
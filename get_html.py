@@ -1,52 +1,84 @@
 #!/usr/bin/env python3
 """
-Get full HTML content from ifm AL1350 to understand data structure
+Get HTML content from ifm AL1350 to understand data structure
 """
 
+import argparse
 import requests
 import re
-
-
-def get_full_html_content(url):
-    """Get and analyze the complete HTML content"""
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session with keep-alive so repeated requests reuse one TCP connection
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+
+# Precompiled data-pattern regexes (compiling per call re-runs the regex
+# parser on every invocation)
+_TEMP_RX = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"(\d+\.?\d*)\s*°C",
+        r"temperature[:\s]*(\d+\.?\d*)",
+        r"temp[:\s]*(\d+\.?\d*)",
+        r"(\d+\.?\d*)\s*celsius",
+    )
+]
+
+_PORT_RX = [re.compile(r"port\s*(\d+)", re.IGNORECASE)]
+
+_HEX_RX = [re.compile(p) for p in (r"0x[0-9a-fA-F]+", r"[0-9a-fA-F]{4,8}")]
+
+
+# Cap how much of the body we fetch; the structural clues live in the
+# first few KB and dumping a full page to the terminal dominates runtime
+MAX_BODY_BYTES = 65536
+
+
+def get_full_html_content(url, verbose=False):
+    """Get and analyze the HTML content (capped at MAX_BODY_BYTES)"""
     try:
-        response = requests.get(url, timeout=5)
+        response = SESSION.get(url, timeout=5, stream=True)
         if response.status_code == 200:
-            content = response.text
-            print(f"✅ Full HTML content retrieved ({len(content)} chars)")
-            print("=" * 80)
-            print(content)
-            print("=" * 80)
+            # decode_content=True lets urllib3 un-gzip the stream; the
+            # raw read would otherwise hand back compressed bytes that
+            # no regex pass could match
+            content = response.raw.read(MAX_BODY_BYTES, decode_content=True).decode(
+                "utf-8", "replace"
+            )
+            print(f"✅ HTML content retrieved ({len(content)} chars)")
+
+            if verbose:
+                print("\n📝 HTML sample (first 500 chars):")
+                print("=" * 80)
+                print(content[:500])
+                print("=" * 80)
 
             # Look for any data patterns
             print("\n🔍 Looking for data patterns...")
 
             # Look for temperature values
-            temp_patterns = [
-                r"(\d+\.?\d*)\s*°C",
-                r"temperature[:\s]*(\d+\.?\d*)",
-                r"temp[:\s]*(\d+\.?\d*)",
-                r"(\d+\.?\d*)\s*celsius",
-            ]
-
-            for pattern in temp_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for rx in _TEMP_RX:
+                matches = rx.findall(content)
                 if matches:
                     print(f"🌡️ Temperature values found: {matches}")
 
             # Look for port information
-            port_patterns = [r"port\s*(\d+)", r"Port\s*(\d+)", r"PORT\s*(\d+)"]
-
-            for pattern in port_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
+            for rx in _PORT_RX:
+                matches = rx.findall(content)
                 if matches:
                     print(f"🔌 Port numbers found: {matches}")
 
             # Look for hex data
-            hex_patterns = [r"0x[0-9a-fA-F]+", r"[0-9a-fA-F]{4,8}"]
-
-            for pattern in hex_patterns:
-                matches = re.findall(pattern, content)
+            for rx in _HEX_RX:
+                matches = rx.findall(content)
                 if matches:
                     print(f"🔢 Hex values found: {matches}")
 
@@ -61,11 +93,21 @@ def get_full_html_content(url):
 
 
 def main():
-    device_ip = "192.168.1.101"
-    base_url = f"http://{device_ip}"
-
-    print(f"🔗 Getting full HTML from ifm AL1350 at {device_ip}")
-    get_full_html_content(base_url)
+    parser = argparse.ArgumentParser(
+        description="Get HTML content from ifm AL1350 to understand data structure"
+    )
+    parser.add_argument(
+        "ip", nargs="?", default="192.168.1.101", help="IP address of the AL1350"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print a sample of the HTML body"
+    )
+    args = parser.parse_args()
+
+    base_url = f"http://{args.ip}"
+
+    print(f"🔗 Getting HTML from ifm AL1350 at {args.ip}")
+    get_full_html_content(base_url, verbose=args.verbose)
 
 
 if __name__ == "__main__":
@@ -18,38 +18,100 @@ Requirements:
     - Linux/Mac: arp command (usually pre-installed)
 """
 
+import argparse
+import ipaddress
 import subprocess
 import re
 import sys
 import os
-import requests
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 
 # Add src directory to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
+# Shared session with keep-alive so candidate probes reuse pooled
+# connections. Created lazily so the requests import chain is deferred
+# until the first HTTP probe (keeps console-script startup fast).
+_SESSION = None
+
+
+def get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.mount(
+            "http://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+    return _SESSION
+
+# Matches "<ip> ... <mac>" on a single ARP table line (Windows and Unix
+# formats). Compiled once; matched per line so the lazy gap only ever
+# spans one short line instead of the whole ARP dump.
+_ARP_RX = re.compile(
+    r"(\d+\.\d+\.\d+\.\d+).*?([0-9a-fA-F]{2}(?:[:-][0-9a-fA-F]{2}){5})"
+)
+
+# Known ifm electronic OUI prefixes
+_IFM_PREFIXES = ("00:02:01", "00:30:26")
+
+
+# Neighbour-table dumps barely change within a discovery session, so the
+# command output is cached for a short TTL to avoid repeated fork+exec
+_ARP_CACHE = {"t": 0.0, "out": ""}
+_ARP_CACHE_TTL = 5.0
+
 
 def run_arp_command() -> str:
     """
-    Execute the ARP command and return the output
+    Dump the system neighbour (ARP) table and return the output
+
+    On Linux this prefers `ip -4 neigh show`, which is faster than `arp -a`
+    and has a stable machine-parseable format; other platforms use `arp -a`.
+    Output is cached for a few seconds since discovery typically reads the
+    table several times per session.
 
     Returns:
-        str: ARP command output
+        str: Neighbour table output
     """
-    try:
-        if sys.platform.startswith("win"):
-            result = subprocess.run(["arp", "-a"], capture_output=True, text=True)
-        else:
-            result = subprocess.run(["arp", "-a"], capture_output=True, text=True)
+    if _ARP_CACHE["out"] and time.monotonic() - _ARP_CACHE["t"] < _ARP_CACHE_TTL:
+        return _ARP_CACHE["out"]
+
+    if sys.platform.startswith("linux"):
+        commands = [["ip", "-4", "neigh", "show"], ["arp", "-a"]]
+    else:
+        commands = [["arp", "-a"]]
+
+    for command in commands:
+        try:
+            result = subprocess.run(
+                command, capture_output=True, text=True, timeout=2
+            )
+        except FileNotFoundError:
+            continue
+        except subprocess.TimeoutExpired:
+            print(f"❌ {command[0]} command timed out")
+            continue
 
         if result.returncode == 0:
+            _ARP_CACHE["t"] = time.monotonic()
+            _ARP_CACHE["out"] = result.stdout
             return result.stdout
         else:
-            print(f"❌ ARP command failed: {result.stderr}")
-            return ""
-    except FileNotFoundError:
-        print("❌ ARP command not found. Please ensure it's installed.")
-        return ""
+            print(f"❌ {command[0]} command failed: {result.stderr}")
+
+    print("❌ No working ARP command found. Please ensure one is installed.")
+    return ""
 
 
 def parse_arp_output(arp_output: str) -> List[Dict[str, str]]:
@@ -64,16 +126,14 @@ def parse_arp_output(arp_output: str) -> List[Dict[str, str]]:
     """
     devices = []
 
-    # Regex pattern to match IP and MAC addresses
-    # Supports both Windows and Unix format
-    pattern = r"(\d+\.\d+\.\d+\.\d+)\s+.*?([0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2}[:-][0-9a-fA-F]{2})"
-
-    matches = re.findall(pattern, arp_output)
-
-    for ip, mac in matches:
-        # Normalize MAC address format
-        mac_normalized = mac.replace("-", ":").upper()
-        devices.append({"ip": ip, "mac": mac_normalized, "mac_raw": mac})
+    # Scan line by line with the precompiled pattern
+    for line in arp_output.splitlines():
+        match = _ARP_RX.search(line)
+        if match:
+            ip, mac = match.groups()
+            # Normalize MAC address format
+            mac_normalized = mac.replace("-", ":").upper()
+            devices.append({"ip": ip, "mac": mac_normalized, "mac_raw": mac})
 
     return devices
 
@@ -91,39 +151,106 @@ def is_ifm_device(mac_address: str) -> bool:
     Returns:
         bool: True if likely an ifm device
     """
-    mac_upper = mac_address.upper()
+    return mac_address.upper().startswith(_IFM_PREFIXES)
 
-    # Known ifm OUI prefixes
-    ifm_prefixes = [
-        "00:02:01",  # Common ifm prefix
-        "00:30:26",  # Another ifm prefix
-    ]
 
-    for prefix in ifm_prefixes:
-        if mac_upper.startswith(prefix):
-            return True
+def is_plausible_candidate(ip_address: str) -> bool:
+    """
+    Check if an IP address could plausibly host an IO-Link Master
 
-    return False
+    An AL1350 sits either on a link-local address (RFC 3927, its
+    factory default) or a private LAN subnet. Anything else — public
+    addresses, multicast, malformed entries — is not worth an HTTP probe.
 
+    Args:
+        ip_address (str): IP address to validate
 
-def test_iolink_connection(ip_address: str) -> bool:
+    Returns:
+        bool: True if the address is worth probing
+    """
+    try:
+        ip = ipaddress.IPv4Address(ip_address)
+    except (ipaddress.AddressValueError, ValueError):
+        return False
+
+    return ip.is_link_local or (ip.is_private and not ip.is_loopback)
+
+
+def probe_http_liveness(ip_addresses: List[str], timeout: float = 0.5) -> List[str]:
+    """
+    Check which candidates accept TCP connections on port 80
+
+    Uses non-blocking connects collected through a selector, so all
+    candidates are probed within one timeout window on one thread. This
+    is a cheap prefilter before the full HTTP identification probes.
+
+    Args:
+        ip_addresses (List[str]): Candidate IP addresses
+        timeout (float): Probe window in seconds
+
+    Returns:
+        List[str]: Addresses with port 80 open, in input order
+    """
+    import selectors
+    import socket
+
+    results = {ip: False for ip in ip_addresses}
+    sel = selectors.DefaultSelector()
+    socks = []
+
+    for ip in ip_addresses:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            sock.connect((ip, 80))
+        except BlockingIOError:
+            pass
+        except OSError:
+            sock.close()
+            continue
+        sel.register(sock, selectors.EVENT_WRITE, ip)
+        socks.append(sock)
+
+    deadline = time.monotonic() + timeout
+    pending = len(socks)
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for key, _ in sel.select(remaining):
+            error = key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            results[key.data] = error == 0
+            sel.unregister(key.fileobj)
+            pending -= 1
+
+    for sock in socks:
+        sock.close()
+    sel.close()
+
+    return [ip for ip in ip_addresses if results[ip]]
+
+
+def test_iolink_connection(ip_address: str, timeout: float = 3) -> bool:
     """
     Test if the device at the given IP is an IO-Link Master
 
     Args:
         ip_address (str): IP address to test
+        timeout (float): HTTP probe timeout in seconds
 
     Returns:
         bool: True if device responds like an IO-Link Master
     """
+    import requests
+
     try:
         # Test basic HTTP connection
-        response = requests.get(f"http://{ip_address}", timeout=3)
+        response = get_session().get(f"http://{ip_address}", timeout=timeout)
 
         # Check if response looks like ifm device
         if response.status_code == 200:
             content = response.text.lower()
-            if "ifm" in content or "iolink" in content or "al1350" in content:
+            if any(keyword in content for keyword in ("ifm", "iolink", "al1350")):
                 return True
     except requests.RequestException:
         pass
@@ -131,10 +258,13 @@ def test_iolink_connection(ip_address: str) -> bool:
     return False
 
 
-def discover_iolink_master() -> Optional[str]:
+def discover_iolink_master(timeout: float = 3) -> Optional[str]:
     """
     Main discovery function to find IO-Link Master on network
 
+    Args:
+        timeout (float): Per-candidate HTTP probe timeout in seconds
+
     Returns:
         str: IP address of discovered IO-Link Master, None if not found
     """
@@ -162,6 +292,14 @@ def discover_iolink_master() -> Optional[str]:
 
     print("\n🔍 Step 3: Looking for ifm devices...")
 
+    # Drop addresses that cannot plausibly host an IO-Link Master before
+    # any HTTP work (public ranges, loopback, malformed entries)
+    plausible = [d for d in devices if is_plausible_candidate(d["ip"])]
+    skipped = len(devices) - len(plausible)
+    if skipped:
+        print(f"⏭️ Skipped {skipped} implausible address(es)")
+    devices = plausible
+
     # First, check for devices with ifm MAC addresses
     ifm_candidates = []
     for device in devices:
@@ -190,14 +328,31 @@ def discover_iolink_master() -> Optional[str]:
 
     print(f"\n🔍 Step 4: Testing {len(ifm_candidates)} candidate(s)...")
 
-    for device in ifm_candidates:
-        print(f"\n🧪 Testing {device['ip']} ({device['mac']})...")
-
-        if test_iolink_connection(device["ip"]):
-            print(f"✅ IO-Link Master found at {device['ip']}!")
-            return device["ip"]
-        else:
-            print(f"❌ Not an IO-Link Master")
+    # Cheap liveness prefilter: only candidates with port 80 open are
+    # worth a full HTTP identification probe
+    live_ips = set(probe_http_liveness([d["ip"] for d in ifm_candidates]))
+    dead = [d for d in ifm_candidates if d["ip"] not in live_ips]
+    if dead and live_ips:
+        print(f"⏭️ Skipped {len(dead)} candidate(s) with port 80 closed")
+        ifm_candidates = [d for d in ifm_candidates if d["ip"] in live_ips]
+
+    # Probe all candidates concurrently so total wait is one timeout window
+    # instead of one per candidate
+    with ThreadPoolExecutor(max_workers=len(ifm_candidates)) as executor:
+        futures = {
+            executor.submit(test_iolink_connection, device["ip"], timeout): device
+            for device in ifm_candidates
+        }
+
+        for future in as_completed(futures):
+            device = futures[future]
+            if future.result():
+                print(f"✅ IO-Link Master found at {device['ip']} ({device['mac']})!")
+                for pending in futures:
+                    pending.cancel()
+                return device["ip"]
+            else:
+                print(f"❌ {device['ip']} is not an IO-Link Master")
 
     print("\n❌ No IO-Link Master found")
     print("\n💡 Manual check suggestions:")
@@ -210,8 +365,34 @@ def discover_iolink_master() -> Optional[str]:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(
+        description="Find an ifm IO-Link Master on the local network"
+    )
+    parser.add_argument(
+        "ip",
+        nargs="?",
+        help="Skip ARP discovery and test this IP address directly",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=3,
+        help="Per-candidate HTTP probe timeout in seconds (default: 3)",
+    )
+    args = parser.parse_args()
+
+    if args.ip and not is_plausible_candidate(args.ip):
+        print(f"❌ {args.ip} is not a valid LAN/link-local IPv4 address")
+        sys.exit(1)
+
     try:
-        discovered_ip = discover_iolink_master()
+        if args.ip:
+            print(f"🧪 Testing {args.ip} directly...")
+            discovered_ip = (
+                args.ip if test_iolink_connection(args.ip, args.timeout) else None
+            )
+        else:
+            discovered_ip = discover_iolink_master(timeout=args.timeout)
 
         if discovered_ip:
             print(f"\n" + "=" * 60)
@@ -48,6 +48,14 @@ setup(
             "black",
             "flake8",
         ],
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "perf": [
+            "orjson>=3.0.0",
+            "numpy>=1.20.0",
+            "ijson>=3.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
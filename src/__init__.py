@@ -11,3 +11,10 @@ __author__ = "Karim Saadeldin"
 __email__ = "karim2jihad@gmail.com"
 
 __all__ = ["IOLinkMaster", "hex_to_temperature"]
+
+try:
+    from .async_iolink_master import AsyncIOLinkMaster
+
+    __all__.append("AsyncIOLinkMaster")
+except ImportError:  # aiohttp is an optional dependency
+    pass
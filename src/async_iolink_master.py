@@ -0,0 +1,414 @@
+"""
+Async interface for the ifm AL1350 IO-Link Master
+
+This module provides an asyncio variant of the IOLinkMaster class built
+on aiohttp. The workload is entirely network-bound, so issuing the
+per-port requests concurrently over one pooled connection collapses a
+full scan to roughly a single request's latency.
+
+Requires the optional aiohttp dependency:
+
+    pip install aiohttp
+
+Author: Karim Saadeldin
+License: MIT
+Repository: https://github.com/karimGeh/ifm-zz1350-iolink-python
+"""
+
+import asyncio
+from typing import Optional, Dict, Any, Callable, List
+
+try:
+    from .iolink_master import IOLinkMaster
+except ImportError:  # imported outside the package (sys.path style)
+    from iolink_master import IOLinkMaster
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency
+    aiohttp = None
+
+
+class AsyncIOLinkMaster:
+    """
+    Asyncio interface for ifm AL1350 IO-Link Master
+
+    Mirrors the IOLinkMaster API with async methods sharing one
+    aiohttp.ClientSession, so concurrent port queries reuse a pooled
+    keep-alive connection instead of serializing round-trips.
+
+    Usage:
+        async with AsyncIOLinkMaster("192.168.1.101") as master:
+            devices = await master.scan_all_ports()
+
+    Attributes:
+        device_ip (str): IP address of the IO-Link Master
+        base_url (str): Base URL for API requests
+        timeout (int): Request timeout in seconds
+    """
+
+    def __init__(
+        self,
+        device_ip: str = "169.254.178.135",
+        timeout: int = 5,
+        cid: int = 1,
+        dedup_window: float = 0.05,
+    ):
+        """
+        Prepare an async connection to the IO-Link Master
+
+        The HTTP session is created lazily on first use (or via the
+        async context manager); no network traffic happens here.
+
+        Args:
+            device_ip (str): IP address of the IO-Link Master device
+            timeout (int): Request timeout in seconds
+            cid (int): Command ID for API requests
+            dedup_window (float): Seconds a completed request result
+                lingers so bursty identical callers coalesce into one
+                round-trip (0 disables the linger)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required for AsyncIOLinkMaster "
+                "(install with: pip install aiohttp)"
+            )
+
+        self.device_ip = device_ip
+        self.base_url = f"http://{device_ip}"
+        self.timeout = timeout
+        self.cid = cid
+        self.dedup_window = dedup_window
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+        # In-flight futures keyed by (endpoint, cid): concurrent callers
+        # asking for the same endpoint share one round-trip instead of
+        # issuing identical POSTs
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Create the pooled HTTP session on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"Content-Type": "application/json"},
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def make_request(
+        self, endpoint: str, cid: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Make a POST request to the IO-Link Master API
+
+        Concurrent identical requests (same endpoint and cid) are
+        coalesced: the first caller issues the POST and the rest await
+        its future, so e.g. scan_all_ports and a running monitor on the
+        same port cost one round-trip instead of two.
+
+        Args:
+            endpoint (str): API endpoint path (adr)
+            cid (int, optional): Command ID for API requests
+
+        Returns:
+            str: Response data if successful, None if failed
+        """
+        key = (endpoint, cid if cid is not None else self.cid)
+
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await existing
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+
+        try:
+            result = await self._do_request(endpoint, key[1])
+        except BaseException as e:
+            self._inflight.pop(key, None)
+            future.cancel()
+            raise
+
+        future.set_result(result)
+        if self.dedup_window > 0:
+            # Let the completed future linger briefly so bursty callers
+            # still coalesce, then evict
+            loop.call_later(self.dedup_window, self._inflight.pop, key, None)
+        else:
+            self._inflight.pop(key, None)
+
+        return result
+
+    async def _do_request(self, endpoint: str, cid: int) -> Optional[str]:
+        """Issue the actual POST for make_request (no deduplication)"""
+        payload = {"code": "request", "cid": cid, "adr": endpoint}
+
+        session = await self._get_session()
+
+        try:
+            async with session.post(self.base_url, json=payload) as response:
+                if response.status != 200:
+                    print(f"❌ HTTP Request failed: {response.status}")
+                    return None
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"❌ Request error: {e}")
+            return None
+
+        if data.get("code") == 200 and "data" in data:
+            if "value" in data["data"]:
+                return str(data["data"]["value"])
+            return str(data["data"])
+        elif data.get("code") == 404:
+            print(f"❌ API Error 404: Endpoint not found - {endpoint}")
+        else:
+            print(f"❌ API Error {data.get('code')}: {data}")
+        return None
+
+    async def get_device_status(self, port: int, cid: Optional[int] = None) -> str:
+        """
+        Get the connection status of a device on a specific port
+
+        Args:
+            port (int): Port number (1-based)
+
+        Returns:
+            str: Device status ('2' = connected, '1' = disconnected, etc.)
+        """
+        return (
+            await self.make_request(
+                f"/iolinkmaster/port[{port}]/iolinkdevice/status/getdata", cid=cid
+            )
+            or "0"
+        )
+
+    async def get_device_name(self, port: int, cid: Optional[int] = None) -> str:
+        """
+        Get the product name of a device connected to a specific port
+
+        Args:
+            port (int): Port number (1-based)
+
+        Returns:
+            str: Device product name
+        """
+        return (
+            await self.make_request(
+                f"/iolinkmaster/port[{port}]/iolinkdevice/productname/getdata", cid=cid
+            )
+            or "Unknown"
+        )
+
+    async def get_device_data(self, port: int, cid: Optional[int] = None) -> str:
+        """
+        Get raw process data from a device on a specific port
+
+        Args:
+            port (int): Port number (1-based)
+
+        Returns:
+            str: Raw device data (hexadecimal format)
+        """
+        return (
+            await self.make_request(
+                f"/iolinkmaster/port[{port}]/iolinkdevice/pdin/getdata", cid=cid
+            )
+            or "0x0000"
+        )
+
+    async def get_temperature_celsius(
+        self, port: int, cid: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        Read process data from a port and convert it to Celsius
+
+        Delegates the TV7105 decode to the shared
+        IOLinkMaster.parse_temperature, so range checking and logging
+        match the sync API.
+
+        Args:
+            port (int): Port number (1-based)
+
+        Returns:
+            float: Temperature in Celsius, None if conversion fails
+        """
+        raw_data = await self.get_device_data(port, cid=cid)
+        return IOLinkMaster.parse_temperature(raw_data)
+
+    async def scan_all_ports(
+        self, port_count: int = 4, cid: Optional[int] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Scan all ports concurrently and return connected device info
+
+        Statuses for all ports are gathered in parallel, then name and
+        process data for the connected ports, so a full scan costs about
+        two request latencies regardless of port count.
+
+        Args:
+            port_count (int): Number of ports to scan (4 for AL1350)
+
+        Returns:
+            dict: Dictionary with port numbers as keys and device info as values
+        """
+        ports = list(range(1, port_count + 1))
+
+        statuses = await asyncio.gather(
+            *(self.get_device_status(port, cid=cid) for port in ports)
+        )
+
+        results = {
+            port: {"port": port, "status": status, "connected": status == "2"}
+            for port, status in zip(ports, statuses)
+        }
+
+        connected_ports = [port for port in ports if results[port]["connected"]]
+        if connected_ports:
+            names_and_data = await asyncio.gather(
+                *(self.get_device_name(port, cid=cid) for port in connected_ports),
+                *(self.get_device_data(port, cid=cid) for port in connected_ports),
+            )
+            names = names_and_data[: len(connected_ports)]
+            data = names_and_data[len(connected_ports) :]
+
+            for port, name, raw_data in zip(connected_ports, names, data):
+                results[port].update(
+                    {
+                        "device_name": name,
+                        "raw_data": raw_data,
+                        # Convert the pdin we already fetched instead of
+                        # re-requesting it through get_temperature_celsius
+                        "temperature_c": IOLinkMaster.parse_temperature(raw_data),
+                    }
+                )
+
+        return results
+
+    async def _sample_loop(
+        self,
+        port: int,
+        interval: float,
+        on_sample: Callable[[int, Optional[float]], None],
+        duration: Optional[float] = None,
+    ):
+        """
+        Poll one port forever (or for `duration` seconds), calling
+        on_sample(port, temperature) for each reading
+
+        Uses absolute deadlines on the event-loop clock so the cadence
+        stays exact even when a read takes hundreds of ms.
+        """
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        next_deadline = start_time
+
+        while True:
+            if duration is not None and loop.time() - start_time >= duration:
+                return
+
+            temperature = await self.get_temperature_celsius(port)
+            on_sample(port, temperature)
+
+            next_deadline += interval
+            await asyncio.sleep(max(0.0, next_deadline - loop.time()))
+
+    async def monitor_many(
+        self,
+        ports: List[int],
+        interval: float = 5,
+        on_sample: Callable[[int, Optional[float]], None] = None,
+        duration: Optional[float] = None,
+    ):
+        """
+        Monitor temperature on several ports concurrently
+
+        One sampler task per port shares the pooled session, so dozens
+        of ports poll from a single OS thread over one keep-alive
+        connection — no thread or process per port needed.
+
+        Args:
+            ports (list): Port numbers to monitor
+            interval (float): Seconds between readings per port
+            on_sample (callable): Called as on_sample(port, temperature)
+                for every reading (temperature is None on read failure)
+            duration (float, optional): Stop after this many seconds
+                (None = run until cancelled)
+        """
+        if on_sample is None:
+            on_sample = lambda port, temperature: print(
+                f"🌡️ Port {port}: "
+                + (f"{temperature:.1f}°C" if temperature is not None else "no reading")
+            )
+
+        await asyncio.gather(
+            *(
+                self._sample_loop(port, interval, on_sample, duration)
+                for port in ports
+            )
+        )
+
+
+def monitor_many_sync(
+    device_ip: str,
+    ports: List[int],
+    interval: float = 5,
+    on_sample: Callable[[int, Optional[float]], None] = None,
+    duration: Optional[float] = None,
+    timeout: int = 5,
+):
+    """
+    Synchronous convenience wrapper around AsyncIOLinkMaster.monitor_many
+
+    Args:
+        device_ip (str): IP address of the IO-Link Master device
+        ports (list): Port numbers to monitor
+        interval (float): Seconds between readings per port
+        on_sample (callable): Called as on_sample(port, temperature)
+        duration (float, optional): Stop after this many seconds
+        timeout (int): Request timeout in seconds
+    """
+
+    async def _monitor():
+        async with AsyncIOLinkMaster(device_ip, timeout=timeout) as master:
+            await master.monitor_many(ports, interval, on_sample, duration)
+
+    asyncio.run(_monitor())
+
+
+def scan_all_ports_sync(
+    device_ip: str = "169.254.178.135", port_count: int = 4, timeout: int = 5
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Synchronous convenience wrapper around AsyncIOLinkMaster.scan_all_ports
+
+    Args:
+        device_ip (str): IP address of the IO-Link Master device
+        port_count (int): Number of ports to scan
+        timeout (int): Request timeout in seconds
+
+    Returns:
+        dict: Dictionary with port numbers as keys and device info as values
+    """
+
+    async def _scan():
+        async with AsyncIOLinkMaster(device_ip, timeout=timeout) as master:
+            return await master.scan_all_ports(port_count=port_count)
+
+    return asyncio.run(_scan())
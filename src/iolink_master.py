@@ -9,11 +9,75 @@ License: MIT
 Repository: https://github.com/karimGeh/ifm-zz1350-iolink-python
 """
 
+import logging
 import requests
 import json
+import socket
+import statistics
+import struct
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional, Dict, Any, List
 
+log = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # optional perf dependency; stdlib json works fine
+    orjson = None
+
+try:
+    import numpy
+except ImportError:  # optional perf dependency for bulk decoding
+    numpy = None
+
+try:
+    import ijson
+except ImportError:  # optional perf dependency for streaming large batches
+    ijson = None
+
+# Batches above this size stream-parse the response (when ijson is
+# installed) instead of buffering the whole body before decoding
+_STREAM_BATCH_THRESHOLD = 8
+
+# Precompiled decoder for the TV7105's signed 16-bit BigEndian value:
+# one C call per sample, no per-call format parsing
+_S16_BE = struct.Struct(">h").unpack_from
+
+# Characters allowed in the 4-digit temperature field; checking
+# membership up front keeps the hot decode path free of exceptions
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that disables Nagle's algorithm on pooled sockets
+
+    The API exchanges tiny JSON bodies (one small packet each way), so
+    Nagle buffering can add ~40 ms per request; TCP_NODELAY removes
+    that, and SO_KEEPALIVE keeps idle pooled connections from being
+    silently dropped between polling intervals.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # Probe idle connections after 30 s, then every 10 s, so a pooled
+    # socket dropped between polling intervals is noticed before the
+    # next request stalls on it (the constants are Linux-only)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
 
 class IOLinkMaster:
     """
@@ -48,23 +112,93 @@ class IOLinkMaster:
         self.timeout = timeout
         self.cid = cid
 
-        print(f"🔗 Connecting to IO-Link Master at {device_ip}")
+        # (connect, read) tuple passed to requests: the device is on the
+        # local segment, so an unreachable host should fail in 1 s
+        # instead of eating the whole read timeout
+        self._timeout = (1.0, timeout)
+
+        # Cache for values that do not change during a session (device
+        # names and the like); see _memoize
+        self._cache: Dict[str, tuple] = {}
+
+        # AL1350 hardware topology: 4 ports. Known up front, so
+        # get_port_count costs nothing; refresh_port_count() asks the
+        # device when a different model needs it
+        self._port_count = 4
+
+        # Pre-built per-port endpoint paths so the hot getters skip the
+        # f-string interpolation on every call (AL1350 has 4 ports;
+        # others are built lazily on first use)
+        self._endpoints: Dict[int, Dict[str, str]] = {}
+        for port in range(1, 5):
+            self._endpoints_for(port)
+
+        # Reusable payload skeleton; make_request only swaps adr and cid
+        # instead of allocating a fresh dict per request. Kept in
+        # thread-local storage so scan_all_ports_parallel workers do not
+        # clobber each other's in-flight payload
+        self._local = threading.local()
+
+        # Persistent session with keep-alive: the device is always the
+        # same host, so pooled connections skip the TCP handshake on
+        # every request after the first
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        self._session.mount(
+            "http://",
+            _LowLatencyAdapter(pool_connections=4, pool_maxsize=8, max_retries=0),
+        )
+
+        log.info("🔗 Connecting to IO-Link Master at %s", device_ip)
 
-        # Test connection
+        # Test connection; this also pre-warms the pool, so the first
+        # real request after __init__ reuses the open connection instead
+        # of paying the TCP handshake. HEAD skips the body transfer —
+        # the reachability answer is in the status line
         try:
-            response = requests.get(self.base_url, timeout=self.timeout)
+            response = self._session.head(self.base_url, timeout=self._timeout)
             if response.status_code == 200:
-                print("✅ Connection established")
+                log.info("✅ Connection established")
             else:
-                print(f"❌ Connection failed: Status {response.status_code}")
+                log.error("❌ Connection failed: Status %s", response.status_code)
                 raise ConnectionError(
                     f"Unable to connect to IO-Link Master at {device_ip}"
                 )
         except requests.RequestException as e:
-            print(f"❌ Connection failed: {e}")
+            log.error("❌ Connection failed: %s", e)
             raise ConnectionError(f"Unable to connect to IO-Link Master at {device_ip}")
 
-    def make_request(self, endpoint: str, cid: Optional[int] = None) -> Optional[str]:
+    def _endpoints_for(self, port: int) -> Dict[str, str]:
+        """
+        Get the pre-built endpoint paths for a port
+
+        Args:
+            port (int): Port number (1-based)
+
+        Returns:
+            dict: Endpoint paths keyed by 'status', 'name' and 'pdin'
+        """
+        endpoints = self._endpoints.get(port)
+        if endpoints is None:
+            base = f"/iolinkmaster/port[{port}]/iolinkdevice"
+            endpoints = self._endpoints[port] = {
+                "status": f"{base}/status/getdata",
+                "name": f"{base}/productname/getdata",
+                "pdin": f"{base}/pdin/getdata",
+            }
+        return endpoints
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def make_request(self, endpoint: str, cid: Optional[int] = None) -> Any:
         """
         Make a POST request to the IO-Link Master API
 
@@ -73,75 +207,293 @@ class IOLinkMaster:
             cid (int, optional): Command ID for API requests
 
         Returns:
-            str: Response data if successful, None if failed
+            The decoded response value (whatever JSON type the device
+            sent — typically str, sometimes int/dict), None if failed
 
         Raises:
             requests.RequestException: If request fails
         """
-        payload = {
-            "code": "request",
-            "cid": cid if cid is not None else self.cid,
-            "adr": endpoint,
-        }
+        try:
+            payload = self._local.payload
+        except AttributeError:
+            payload = self._local.payload = {
+                "code": "request",
+                "cid": self.cid,
+                "adr": None,
+            }
+        payload["cid"] = cid if cid is not None else self.cid
+        payload["adr"] = endpoint
 
         try:
-            response = requests.post(
-                self.base_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=self.timeout,
+            response = self._session.post(
+                self.base_url, json=payload, timeout=self._timeout
             )
 
             if response.status_code == 200:
                 try:
-                    data = response.json()
-
-                    # Check for successful response
-                    if data.get("code") == 200 and "data" in data:
-                        if "value" in data["data"]:
-                            return str(data["data"]["value"])
-                        else:
-                            return str(data["data"])
-                    elif data.get("code") == 404:
-                        print(f"❌ API Error 404: Endpoint not found - {endpoint}")
-                        return None
-                    else:
-                        print(f"❌ API Error {data.get('code')}: {data}")
-                        return None
-
+                    data = self._decode_json(response)
+                    return self._extract_value(data, endpoint)
                 except (json.JSONDecodeError, ValueError) as e:
-                    print(f"❌ JSON decode error: {e}")
+                    log.error("❌ JSON decode error: %s", e)
                     return response.text.strip()
             else:
-                print(f"❌ HTTP Request failed: {response.status_code}")
+                log.error("❌ HTTP Request failed: %s", response.status_code)
                 return None
 
         except requests.RequestException as e:
-            print(f"❌ Request error: {e}")
+            log.error("❌ Request error: %s", e)
             raise
 
+    @staticmethod
+    def _decode_json(response) -> Any:
+        """
+        Decode a response body to Python objects
+
+        Uses orjson when installed (2-5x faster and consumes the raw
+        bytes directly); falls back to the stdlib decoder otherwise.
+
+        Args:
+            response: requests.Response object
+
+        Returns:
+            Decoded JSON value
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    @staticmethod
+    def _extract_value(data: Dict[str, Any], endpoint: str) -> Any:
+        """
+        Extract the value field from a single decoded API response
+
+        The value is returned as whatever JSON type the device sent —
+        no str() round-trip, so typed accessors coerce once at the edge
+        instead of parsing a stringified value back.
+
+        Args:
+            data (dict): Decoded JSON response object
+            endpoint (str): Endpoint the response belongs to (for messages)
+
+        Returns:
+            Response value if successful, None if failed
+        """
+        if data.get("code") == 200 and "data" in data:
+            if "value" in data["data"]:
+                return data["data"]["value"]
+            else:
+                return data["data"]
+        elif data.get("code") == 404:
+            log.error("❌ API Error 404: Endpoint not found - %s", endpoint)
+            return None
+        else:
+            log.error("❌ API Error %s: %s", data.get("code"), data)
+            return None
+
+    def batch_request(
+        self, endpoints: List[str], cid: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Request several endpoints in a single POST
+
+        The ifm JSON protocol accepts an array of request objects (the
+        same {code, cid, adr} schema wrapped in a list), so N endpoints
+        can share one HTTP round-trip instead of paying N round-trips.
+        Falls back to one request per endpoint if the device does not
+        return a list.
+
+        Args:
+            endpoints (list): API endpoint paths (adr) to request
+            cid (int, optional): Base command ID; each entry gets cid + index
+
+        Returns:
+            list: Response values in endpoint order (None entries on failure)
+        """
+        base_cid = cid if cid is not None else self.cid
+        payload = [
+            {"code": "request", "cid": base_cid + i, "adr": adr}
+            for i, adr in enumerate(endpoints)
+        ]
+
+        # Large batches stream-parse the response array item by item so
+        # peak memory stays at one envelope instead of the whole body;
+        # small batches stay on the buffered (orjson) path for latency
+        stream = ijson is not None and len(endpoints) > _STREAM_BATCH_THRESHOLD
+
+        try:
+            response = self._session.post(
+                self.base_url, json=payload, timeout=self._timeout, stream=stream
+            )
+
+            try:
+                if response.status_code == 200:
+                    by_cid = None
+                    if stream:
+                        try:
+                            by_cid = {
+                                item.get("cid"): item
+                                for item in ijson.items(response.raw, "item")
+                            }
+                        except ijson.JSONError as e:
+                            log.error("❌ JSON decode error: %s", e)
+                    else:
+                        try:
+                            data = self._decode_json(response)
+                        except (json.JSONDecodeError, ValueError) as e:
+                            log.error("❌ JSON decode error: %s", e)
+                            data = None
+                        if isinstance(data, list):
+                            by_cid = {item.get("cid"): item for item in data}
+
+                    if by_cid:
+                        return [
+                            self._extract_value(by_cid.get(base_cid + i, {}), adr)
+                            for i, adr in enumerate(endpoints)
+                        ]
+            finally:
+                response.close()
+
+        except requests.RequestException as e:
+            log.error("❌ Batch request error: %s", e)
+
+        # Fallback: device (or firmware) does not support list payloads
+        return [self.make_request(adr, cid=cid) for adr in endpoints]
+
+    def make_batch_request(
+        self, adrs: List[str], cid: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Request several addresses through the native getdatamulti endpoint
+
+        Newer AL1350 firmware exposes /iolinkmaster/getdatamulti, which
+        answers every listed address in one round-trip and one response
+        object — cheaper on the device side than the envelope-array form
+        because the master parses a single request. Falls back to
+        batch_request (and from there to per-endpoint requests) when the
+        firmware does not implement it.
+
+        Args:
+            adrs (list): API endpoint paths (adr) to request
+            cid (int, optional): Command ID for the batch request
+
+        Returns:
+            dict: Values keyed by adr (None entries on failure)
+        """
+        payload = {
+            "code": "request",
+            "cid": cid if cid is not None else self.cid,
+            "adr": "/iolinkmaster/getdatamulti",
+            "data": {"datatosend": [{"adr": adr} for adr in adrs]},
+        }
+
+        try:
+            response = self._session.post(
+                self.base_url, json=payload, timeout=self._timeout
+            )
+
+            if response.status_code == 200:
+                try:
+                    data = self._decode_json(response)
+                except (json.JSONDecodeError, ValueError) as e:
+                    log.error("❌ JSON decode error: %s", e)
+                    data = None
+
+                if isinstance(data, dict) and data.get("code") == 200:
+                    entries = data.get("data") or {}
+                    return {
+                        adr: self._extract_multi_entry(entries.get(adr))
+                        for adr in adrs
+                    }
+
+        except requests.RequestException as e:
+            log.error("❌ Batch request error: %s", e)
+
+        # Fallback: firmware without getdatamulti support
+        return dict(zip(adrs, self.batch_request(adrs, cid=cid)))
+
+    @staticmethod
+    def _extract_multi_entry(entry: Any) -> Any:
+        """
+        Extract the value from one getdatamulti response entry
+
+        Entries are {"code": ..., "data": value} objects; tolerate bare
+        values for firmwares that skip the wrapper.
+        """
+        if isinstance(entry, dict):
+            if entry.get("code") not in (None, 200):
+                return None
+            return entry.get("data", entry.get("value"))
+        return entry
+
+    def _memoize(self, key: str, ttl: Optional[float], fn) -> Any:
+        """
+        Return a cached value, calling fn() on miss or expiry
+
+        A None result is treated as a transient failure and is not
+        stored, so the next call retries instead of serving the
+        failure for the whole TTL.
+
+        Args:
+            key (str): Cache key
+            ttl (float, optional): Seconds the entry stays fresh
+                                   (None = never expires)
+            fn (callable): Zero-argument function producing the value
+                           (None on failure)
+
+        Returns:
+            The cached or freshly fetched value
+        """
+        cached = self._cache.get(key)
+        if cached is not None:
+            stored_at, value = cached
+            if ttl is None or time.monotonic() - stored_at < ttl:
+                return value
+
+        value = fn()
+        if value is not None:
+            self._cache[key] = (time.monotonic(), value)
+        return value
+
+    def invalidate_cache(self):
+        """Drop all cached values (use after hot-swapping sensors)"""
+        self._cache.clear()
+
     def get_port_count(self, cid: Optional[int] = None) -> int:
         """
         Get the number of available ports on the IO-Link Master
 
-        Note: Based on AL1350 specifications, this device has 4 ports.
-        The API endpoint for port count may not be available on all firmware versions.
+        The AL1350 is a fixed 4-port device and its firmware often does
+        not implement the port-count endpoint, so this returns the known
+        topology without a network round-trip. Call refresh_port_count()
+        to query the device explicitly (e.g. for other master models).
 
         Returns:
             int: Number of ports available (4 for AL1350)
         """
+        return self._port_count
+
+    def refresh_port_count(self, cid: Optional[int] = None) -> int:
+        """
+        Query the device for its port count and update the cached value
+
+        Falls back to the current value (4 for AL1350) if the endpoint
+        is missing or returns something unparseable.
+
+        Returns:
+            int: Number of ports available
+        """
         try:
             result = self.make_request(
                 "/iolinkmaster/port/numberofports/getdata", cid=cid
             )
             if result:
-                return int(result)
-            else:
-                # Fallback: AL1350 is a 4-port device
-                return 4
+                self._port_count = int(result)
         except (ValueError, TypeError):
-            # Fallback: AL1350 is a 4-port device
-            return 4
+            pass
+        return self._port_count
 
     def get_device_status(self, port: int, cid: Optional[int] = None) -> str:
         """
@@ -153,29 +505,31 @@ class IOLinkMaster:
         Returns:
             str: Device status ('2' = connected, '1' = disconnected, etc.)
         """
-        return (
-            self.make_request(
-                f"/iolinkmaster/port[{port}]/iolinkdevice/status/getdata", cid=cid
-            )
-            or "0"
-        )
+        status = self.make_request(self._endpoints_for(port)["status"], cid=cid)
+        # Some firmware sends the status as a JSON number; normalize once
+        return str(status) if status is not None else "0"
 
     def get_device_name(self, port: int, cid: Optional[int] = None) -> str:
         """
         Get the product name of a device connected to a specific port
 
+        The name only changes when a sensor is swapped, so it is cached
+        for 5 minutes (call invalidate_cache() after hot-swapping).
+
         Args:
             port (int): Port number (1-based)
 
         Returns:
             str: Device product name
         """
-        return (
-            self.make_request(
-                f"/iolinkmaster/port[{port}]/iolinkdevice/productname/getdata", cid=cid
-            )
-            or "Unknown"
-        )
+        def fetch():
+            # None on failure so only real names are memoized; the
+            # "Unknown" fallback stays uncached and the next call retries
+            name = self.make_request(self._endpoints_for(port)["name"], cid=cid)
+            return str(name) if name else None
+
+        name = self._memoize(f"device_name[{port}]", 300, fetch)
+        return name if name is not None else "Unknown"
 
     def get_device_data(self, port: int, cid: Optional[int] = None) -> str:
         """
@@ -187,145 +541,309 @@ class IOLinkMaster:
         Returns:
             str: Raw device data (hexadecimal format)
         """
-        return (
-            self.make_request(
-                f"/iolinkmaster/port[{port}]/iolinkdevice/pdin/getdata", cid=cid
-            )
-            or "0x0000"
-        )
+        return self.make_request(self._endpoints_for(port)["pdin"], cid=cid) or "0x0000"
 
-    def get_temperature_celsius(
-        self, port: int, cid: Optional[int] = None
-    ) -> Optional[float]:
+    @staticmethod
+    def parse_temperature(raw_data: Optional[str]) -> Optional[float]:
         """
-        Convert raw temperature sensor data to Celsius
+        Convert raw TV7105 process data to Celsius (pure function, no I/O)
 
-        This method specifically handles TV7105 temperature sensor data conversion.
         According to the official TV7105 documentation:
         - Temperature is transmitted as 16-bit integer in BigEndian format
         - Formula: Value in [°C] = MeasurementValue * 0.1
         - Range: -53.7°C to 157.5°C
 
         Args:
-            port (int): Port number (1-based)
+            raw_data (str): Raw process data (hexadecimal, with or
+                            without '0x' prefix)
 
         Returns:
             float: Temperature in Celsius, None if conversion fails
         """
-        try:
-            raw_data = self.get_device_data(port, cid=cid)
-
-            if raw_data and len(raw_data) >= 4:
-                # Handle different hex formats
-                if raw_data.startswith("0x"):
-                    hex_str = raw_data[2:]
-                else:
-                    hex_str = raw_data
-
-                # For TV7105, temperature is in the first 16 bits (4 hex digits) of the 32-bit process data
-                if len(hex_str) >= 4:
-                    temp_hex = hex_str[:4]  # First 16 bits (4 hex digits)
-                    hex_value = int(temp_hex, 16)
+        if not isinstance(raw_data, str):
+            return None
+
+        # Handle different hex formats
+        hex_str = raw_data[2:] if raw_data[:2] == "0x" else raw_data
+
+        # For TV7105, temperature is in the first 16 bits (4 hex digits)
+        # of the 32-bit process data. Validate those four characters up
+        # front so the hot path decodes without exception handling.
+        head = hex_str[:4]
+        if len(head) < 4 or not _HEX_DIGITS.issuperset(head):
+            log.debug("Unparseable process data: %r", raw_data)
+            return None
+
+        (temp_raw,) = _S16_BE(bytes.fromhex(head))
+
+        # TV7105 official formula: Value in [°C] = MeasurementValue * 0.1
+        temperature = temp_raw * 0.1
+
+        # Sanity check: TV7105 range is -53.7°C to 157.5°C
+        if -53.7 <= temperature <= 157.5:
+            return temperature
+        log.warning(
+            "⚠️ Temperature %.1f°C out of TV7105 range (-53.7°C to 157.5°C)",
+            temperature,
+        )
+        return None
 
-                    # TV7105 official formula: Value in [°C] = MeasurementValue * 0.1
-                    temperature = hex_value * 0.1
+    def get_temperature_celsius(
+        self, port: int, cid: Optional[int] = None
+    ) -> Optional[float]:
+        """
+        Read process data from a port and convert it to Celsius
 
-                    # Sanity check: TV7105 range is -53.7°C to 157.5°C
-                    if -53.7 <= temperature <= 157.5:
-                        return temperature
-                    else:
-                        print(
-                            f"⚠️ Temperature {temperature:.1f}°C out of TV7105 range (-53.7°C to 157.5°C)"
-                        )
-                        return None
+        Thin wrapper combining get_device_data with parse_temperature;
+        callers that already hold the raw hex (e.g. from a batched scan)
+        should call parse_temperature directly to avoid the extra fetch.
 
-                return None
+        Args:
+            port (int): Port number (1-based)
 
-        except (ValueError, TypeError) as e:
-            print(f"❌ Temperature conversion error: {e}")
-        return None
+        Returns:
+            float: Temperature in Celsius, None if conversion fails
+        """
+        return self.parse_temperature(self.get_device_data(port, cid=cid))
 
     def scan_all_ports(self, cid: Optional[int] = None) -> Dict[int, Dict[str, Any]]:
         """
         Scan all ports and return information about connected devices
 
+        Port statuses are fetched in one getdatamulti request, then
+        device name and process data for the connected ports in a
+        second, so a full scan costs two round-trips instead of up to
+        4 per port.
+
         Returns:
             dict: Dictionary with port numbers as keys and device info as values
         """
-        port_count = self.get_port_count(cid=cid)
+        port_count = self._port_count
+        ports = list(range(1, port_count + 1))
         results = {}
 
-        print(f"📊 Scanning {port_count} ports...")
-
-        for port in range(1, port_count + 1):
-            print(f"\n🔍 Scanning Port {port}...")
-
-            status = self.get_device_status(port, cid=cid)
+        log.info("📊 Scanning %d ports...", port_count)
 
-            port_info = {"port": port, "status": status, "connected": status == "2"}
+        # Batch 1: status of every port
+        statuses = self.make_batch_request(
+            [self._endpoints_for(port)["status"] for port in ports], cid=cid
+        )
 
-            if status == "2":  # Device connected
-                port_info.update(
+        for port in ports:
+            status = statuses.get(self._endpoints_for(port)["status"])
+            status = str(status) if status is not None else "0"
+            results[port] = {
+                "port": port,
+                "status": status,
+                "connected": status == "2",
+            }
+
+        # Batch 2: name and process data for the connected ports only
+        connected_ports = [port for port in ports if results[port]["connected"]]
+        if connected_ports:
+            adrs = []
+            for port in connected_ports:
+                endpoints = self._endpoints_for(port)
+                adrs += [endpoints["name"], endpoints["pdin"]]
+            values = self.make_batch_request(adrs, cid=cid)
+
+            for port in connected_ports:
+                endpoints = self._endpoints_for(port)
+                name = values.get(endpoints["name"])
+                raw_data = values.get(endpoints["pdin"]) or "0x0000"
+                results[port].update(
                     {
-                        "device_name": self.get_device_name(port, cid=cid),
-                        "raw_data": self.get_device_data(port, cid=cid),
-                        "temperature_c": self.get_temperature_celsius(port, cid=cid),
+                        "device_name": str(name) if name else "Unknown",
+                        "raw_data": raw_data,
+                        # Convert the pdin we already fetched instead of
+                        # re-requesting it through get_temperature_celsius
+                        "temperature_c": self.parse_temperature(raw_data),
                     }
                 )
-                print(f"✅ Device: {port_info['device_name']}")
-                print(f"📊 Raw data: {port_info['raw_data']}")
-                if port_info["temperature_c"] is not None:
-                    print(f"🌡️ Temperature: {port_info['temperature_c']:.1f}°C")
-            else:
-                print("❌ No device connected")
 
-            results[port] = port_info
+        if log.isEnabledFor(logging.INFO):
+            for port in ports:
+                port_info = results[port]
+                log.info("🔍 Port %d:", port)
+                if port_info["connected"]:
+                    log.info("✅ Device: %s", port_info["device_name"])
+                    log.info("📊 Raw data: %s", port_info["raw_data"])
+                    if port_info["temperature_c"] is not None:
+                        log.info(
+                            "🌡️ Temperature: %.1f°C", port_info["temperature_c"]
+                        )
+                else:
+                    log.info("❌ No device connected")
 
         return results
 
+    def _scan_port(self, port: int, cid: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Collect the full info dict for a single port (worker for
+        scan_all_ports_parallel)
+
+        Args:
+            port (int): Port number (1-based)
+
+        Returns:
+            dict: Port info in the same shape as scan_all_ports entries
+        """
+        status = self.get_device_status(port, cid=cid)
+        info: Dict[str, Any] = {
+            "port": port,
+            "status": status,
+            "connected": status == "2",
+        }
+        if info["connected"]:
+            raw_data = self.get_device_data(port, cid=cid)
+            info.update(
+                {
+                    "device_name": self.get_device_name(port, cid=cid),
+                    "raw_data": raw_data,
+                    "temperature_c": self.parse_temperature(raw_data),
+                }
+            )
+        return info
+
+    def scan_all_ports_parallel(
+        self, max_workers: Optional[int] = None, cid: Optional[int] = None
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Scan all ports concurrently using a thread pool
+
+        Each port is scanned by its own worker thread over the shared
+        keep-alive session (whose pool holds enough connections for the
+        default worker count), so a full scan takes roughly one port's
+        latency instead of the sum. For fleets of masters, the same
+        pattern scales across instances:
+
+            with ThreadPoolExecutor(8) as ex:
+                results = list(ex.map(lambda m: m.scan_all_ports(), masters))
+
+        Args:
+            max_workers (int, optional): Worker threads to use; defaults
+                to one per port, capped at 8 to match the session pool
+
+        Returns:
+            dict: Dictionary with port numbers as keys and device info as values
+        """
+        if max_workers is None:
+            max_workers = min(self._port_count, 8)
+        ports = range(1, self._port_count + 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            infos = executor.map(lambda port: self._scan_port(port, cid=cid), ports)
+        return {info["port"]: info for info in infos}
+
     def monitor_temperature(
         self,
         port: int,
         interval: int = 5,
         duration: Optional[int] = None,
         cid: Optional[int] = None,
+        adaptive: bool = False,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
     ):
         """
         Monitor temperature from a sensor in real-time
 
+        With adaptive=True the polling rate follows the observed signal:
+        the spread (stddev) of the last few readings scales the interval
+        between min_interval and max_interval, so a flat temperature is
+        sampled lazily while a moving one is tracked closely — far fewer
+        requests over a long session with no loss of fidelity.
+
         Args:
             port (int): Port number to monitor
-            interval (int): Seconds between readings
+            interval (int): Seconds between readings (the baseline when
+                            adaptive sampling is on)
             duration (int): Total monitoring duration in seconds (None for infinite)
             cid (int, optional): Command ID for API requests
+            adaptive (bool): Scale the interval with signal variability
+            min_interval (float, optional): Fastest adaptive rate
+                                            (default interval / 4)
+            max_interval (float, optional): Slowest adaptive rate
+                                            (default interval * 4)
         """
-        print(f"🌡️ Starting temperature monitoring on Port {port}")
-        print(f"📊 Reading interval: {interval} seconds")
-        print("Press Ctrl+C to stop monitoring\n")
-
-        start_time = time.time()
+        log.info("🌡️ Starting temperature monitoring on Port %d", port)
+        log.info("📊 Reading interval: %d seconds", interval)
+        log.info("Press Ctrl+C to stop monitoring")
+
+        if adaptive:
+            if min_interval is None:
+                min_interval = interval / 4
+            if max_interval is None:
+                max_interval = interval * 4
+            # Rolling window for the variability estimate; a stddev of
+            # ~0.3°C (gain 10) is enough to pull sampling back to the
+            # baseline rate from the stable-signal maximum
+            window: deque = deque(maxlen=8)
+            gain = 10.0
+
+        # Absolute deadlines on the monotonic clock: sleeping until
+        # next_deadline (instead of a fixed interval after each read)
+        # keeps the cadence exact even when reads take hundreds of ms,
+        # and is immune to wall-clock jumps
+        start_time = time.monotonic()
+        next_deadline = start_time
 
         try:
             while True:
-                current_time = time.time()
-
                 # Check duration limit
-                if duration and (current_time - start_time) >= duration:
-                    print(f"\n⏰ Monitoring completed ({duration} seconds)")
+                if duration and (time.monotonic() - start_time) >= duration:
+                    log.info("⏰ Monitoring completed (%d seconds)", duration)
                     break
 
                 temperature = self.get_temperature_celsius(port, cid=cid)
-                timestamp = time.strftime("%H:%M:%S")
 
-                if temperature is not None:
-                    print(f"[{timestamp}] 🌡️ Port {port}: {temperature:.1f}°C")
-                else:
-                    print(f"[{timestamp}] ❌ Port {port}: Unable to read temperature")
+                # Per-sample chatter is debug-level so tight polling loops
+                # pay no stdout/formatting cost unless explicitly enabled
+                if log.isEnabledFor(logging.DEBUG):
+                    timestamp = time.strftime("%H:%M:%S")
+                    if temperature is not None:
+                        log.debug(
+                            "[%s] 🌡️ Port %d: %.1f°C", timestamp, port, temperature
+                        )
+                    else:
+                        log.debug(
+                            "[%s] ❌ Port %d: Unable to read temperature",
+                            timestamp,
+                            port,
+                        )
+
+                step = interval
+                if adaptive:
+                    if temperature is not None:
+                        window.append(temperature)
+                    if len(window) >= 2:
+                        spread = statistics.stdev(window)
+                        step = min(
+                            max(interval * 4 / (1 + gain * spread), min_interval),
+                            max_interval,
+                        )
 
-                time.sleep(interval)
+                next_deadline += step
+                time.sleep(max(0.0, next_deadline - time.monotonic()))
 
         except KeyboardInterrupt:
-            print(f"\n🛑 Monitoring stopped by user")
+            log.info("🛑 Monitoring stopped by user")
+
+
+# Lazily-built table mapping every unsigned 16-bit value (offset so the
+# signed range lands at index raw + 32768) to its temperature; bulk log
+# decoding then replaces the per-sample multiply with one indexed read
+_TEMP_LUT = None
+
+
+def _temperature_lut():
+    """Build the 65 536-entry value-to-°C table on first use (~0.5 MB)"""
+    global _TEMP_LUT
+    if _TEMP_LUT is None:
+        if numpy is not None:
+            _TEMP_LUT = numpy.arange(-32768, 32768, dtype=numpy.float32) * 0.1
+        else:
+            _TEMP_LUT = [raw * 0.1 for raw in range(-32768, 32768)]
+    return _TEMP_LUT
 
 
 def hex_to_temperature(hex_value: str) -> Optional[float]:
@@ -342,14 +860,45 @@ def hex_to_temperature(hex_value: str) -> Optional[float]:
     """
     try:
         if hex_value and hex_value.startswith("0x"):
-            decimal_value = int(hex_value, 16)
-            # TV7105 official formula: Value in [°C] = MeasurementValue * 0.1
-            return decimal_value * 0.1
+            # The TV7105 transmits a signed 16-bit integer in BigEndian
+            # format; look it up in the precomputed table, which handles
+            # the negative range (-53.7°C) via the +0x8000 index offset
+            value = int(hex_value[2:6], 16) & 0xFFFF
+            return float(_temperature_lut()[(value + 0x8000) & 0xFFFF])
     except (ValueError, TypeError, AttributeError):
         pass
     return None
 
 
+def hex_array_to_temperature(hex_values: List[str]) -> List[Optional[float]]:
+    """
+    Convert a batch of hex temperature values to Celsius
+
+    For offline decoding of large CSV/log dumps: with numpy installed
+    the whole batch is decoded in one vectorized call
+    (frombuffer('>i2') * 0.1) instead of per-sample Python arithmetic;
+    without numpy, or when the batch contains malformed entries, it
+    falls back to hex_to_temperature per value.
+
+    Args:
+        hex_values (list): Hexadecimal temperature values (e.g. ['0x0157'])
+
+    Returns:
+        list: Temperatures in Celsius, None entries where conversion fails
+    """
+    if numpy is not None:
+        try:
+            if all(value.startswith("0x") for value in hex_values):
+                joined = "".join(value[2:6].zfill(4) for value in hex_values)
+                raw = numpy.frombuffer(bytes.fromhex(joined), dtype=">i2")
+                if len(raw) == len(hex_values):
+                    return [float(t) for t in raw * 0.1]
+        except (ValueError, TypeError, AttributeError):
+            pass  # malformed entry somewhere; decode one by one below
+
+    return [hex_to_temperature(value) for value in hex_values]
+
+
 if __name__ == "__main__":
     # Example usage
     try:
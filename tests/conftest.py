@@ -2,11 +2,28 @@
 Configuration file for pytest
 """
 
+import sys
+import os
+from unittest.mock import patch
+
 import pytest
 
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from iolink_master import IOLinkMaster
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers"""
     config.addinivalue_line(
         "markers", "integration: mark test as integration test (requires hardware)"
     )
+
+
+@pytest.fixture
+def master():
+    """IOLinkMaster built against a mocked connection probe (no network)"""
+    with patch("requests.Session.head") as mock_head:
+        mock_head.return_value.status_code = 200
+        yield IOLinkMaster("192.168.1.101")
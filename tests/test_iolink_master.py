@@ -13,6 +13,8 @@ Requirements:
     - requests-mock (for mocked tests)
 """
 
+import json
+
 import pytest
 import requests
 from unittest.mock import patch, MagicMock
@@ -22,148 +24,210 @@ import os
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from iolink_master import IOLinkMaster, hex_to_temperature
+from iolink_master import IOLinkMaster, hex_to_temperature, hex_array_to_temperature
+
+
+def mock_json_response(payload, status_code=200):
+    """Build a mocked response carrying the payload as real JSON bytes
+
+    The library decodes response.content with orjson when installed and
+    falls back to response.json(), so the mock supports both paths.
+    """
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode()
+    response.json.return_value = payload
+    return response
 
 
 class TestIOLinkMaster:
-    """Test cases for IOLinkMaster class"""
+    """Test cases for IOLinkMaster class
 
-    def test_init_success(self):
-        """Test successful initialization"""
-        with patch("requests.get") as mock_get:
-            mock_get.return_value.status_code = 200
+    Most tests take the `master` fixture from conftest.py, which builds
+    an IOLinkMaster against a mocked connection probe.
+    """
 
-            master = IOLinkMaster("192.168.1.101")
-            assert master.device_ip == "192.168.1.101"
-            assert master.base_url == "http://192.168.1.101"
-            assert master.timeout == 5
+    def test_init_success(self, master):
+        """Test successful initialization"""
+        assert master.device_ip == "192.168.1.101"
+        assert master.base_url == "http://192.168.1.101"
+        assert master.timeout == 5
 
     def test_init_connection_failure(self):
         """Test initialization with connection failure"""
-        with patch("requests.get", side_effect=requests.ConnectionError):
+        with patch("requests.Session.head", side_effect=requests.ConnectionError):
             with pytest.raises(ConnectionError):
                 IOLinkMaster("192.168.1.101")
 
-    def test_make_request_json_response(self):
+    def test_make_request_json_response(self, master):
         """Test make_request with JSON response"""
-        with patch("requests.get") as mock_get, patch("requests.post") as mock_post:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock API request (now uses POST)
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"code": 200, "data": {"value": "4"}}
-            mock_post.return_value = mock_response
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value = mock_json_response(
+                {"code": 200, "data": {"value": "4"}}
+            )
 
             result = master.make_request("/test/endpoint")
             assert result == "4"
 
-    def test_make_request_text_response(self):
+    def test_make_request_text_response(self, master):
         """Test make_request with plain text response"""
-        with patch("requests.get") as mock_get, patch("requests.post") as mock_post:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock API request (now uses POST)
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.side_effect = ValueError  # Not valid JSON
-            mock_response.text.strip.return_value = "plain_text_response"
+            mock_response.content = b"plain_text_response"  # Not valid JSON
+            mock_response.json.side_effect = ValueError
+            mock_response.text = "plain_text_response"
             mock_post.return_value = mock_response
 
             result = master.make_request("/test/endpoint")
             assert result == "plain_text_response"
 
-    def test_make_request_failure(self):
+    def test_make_request_failure(self, master):
         """Test make_request with HTTP error"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock API request failure
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 404
-            mock_get.return_value = mock_response
+            mock_post.return_value = mock_response
 
             result = master.make_request("/test/endpoint")
             assert result is None
 
-    def test_get_port_count(self):
-        """Test get_port_count method"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock port count request
-            with patch.object(master, "make_request", return_value="4"):
-                result = master.get_port_count()
-                assert result == 4
-
-    def test_get_port_count_invalid(self):
-        """Test get_port_count with invalid response"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock invalid port count request
-            with patch.object(master, "make_request", return_value="invalid"):
-                result = master.get_port_count()
-                # Should return 4 (AL1350 fallback) instead of 0
-                assert result == 4
-
-    def test_get_device_status(self):
+    def test_batch_request(self, master):
+        """Test batch_request pairing responses back to endpoints by cid"""
+        with patch("requests.Session.post") as mock_post:
+            # Mock batched API request (responses deliberately out of order)
+            mock_post.return_value = mock_json_response(
+                [
+                    {"cid": 2, "code": 200, "data": {"value": "TV7105"}},
+                    {"cid": 1, "code": 200, "data": {"value": "2"}},
+                ]
+            )
+
+            result = master.batch_request(["/status", "/productname"])
+            assert result == ["2", "TV7105"]
+
+    def test_batch_request_fallback(self, master):
+        """Test batch_request falling back to single requests on non-list response"""
+        with patch("requests.Session.post") as mock_post:
+            # Device answers with a single object instead of a list
+            mock_post.return_value = mock_json_response({"code": 400})
+
+            with patch.object(master, "make_request", return_value="2") as mock_single:
+                result = master.batch_request(["/status", "/productname"])
+                assert result == ["2", "2"]
+                assert mock_single.call_count == 2
+
+    def test_make_batch_request(self, master):
+        """Test make_batch_request parsing a getdatamulti response"""
+        with patch("requests.Session.post") as mock_post:
+            mock_post.return_value = mock_json_response(
+                {
+                    "cid": 1,
+                    "code": 200,
+                    "data": {
+                        "/status": {"code": 200, "data": "2"},
+                        "/productname": {"code": 200, "data": "TV7105"},
+                        "/missing": {"code": 404},
+                    },
+                }
+            )
+
+            result = master.make_batch_request(["/status", "/productname", "/missing"])
+            assert result == {
+                "/status": "2",
+                "/productname": "TV7105",
+                "/missing": None,
+            }
+            # One getdatamulti POST covers all addresses
+            assert mock_post.call_count == 1
+            payload = mock_post.call_args.kwargs["json"]
+            assert payload["adr"] == "/iolinkmaster/getdatamulti"
+            assert payload["data"]["datatosend"] == [
+                {"adr": "/status"},
+                {"adr": "/productname"},
+                {"adr": "/missing"},
+            ]
+
+    def test_make_batch_request_fallback(self, master):
+        """Test make_batch_request falling back when getdatamulti is unsupported"""
+        with patch("requests.Session.post") as mock_post:
+            # Firmware rejects the getdatamulti address
+            mock_post.return_value = mock_json_response({"cid": 1, "code": 404})
+
+            with patch.object(
+                master, "batch_request", return_value=["2", "TV7105"]
+            ) as mock_batch:
+                result = master.make_batch_request(["/status", "/productname"])
+                assert result == {"/status": "2", "/productname": "TV7105"}
+                mock_batch.assert_called_once()
+
+    def test_get_port_count(self, master):
+        """Test get_port_count returns the known topology without a request"""
+        with patch.object(master, "make_request") as mock_rq:
+            result = master.get_port_count()
+            assert result == 4
+            mock_rq.assert_not_called()
+
+    def test_refresh_port_count(self, master):
+        """Test refresh_port_count querying the device and updating the cache"""
+        with patch.object(master, "make_request", return_value="8"):
+            assert master.refresh_port_count() == 8
+            assert master.get_port_count() == 8
+
+    def test_refresh_port_count_invalid(self, master):
+        """Test refresh_port_count with invalid response"""
+        with patch.object(master, "make_request", return_value="invalid"):
+            result = master.refresh_port_count()
+            # Should keep 4 (AL1350 fallback) instead of 0
+            assert result == 4
+
+    def test_get_device_status(self, master):
         """Test get_device_status method"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
+        with patch.object(master, "make_request", return_value="2"):
+            result = master.get_device_status(1)
+            assert result == "2"
 
-            # Mock device status request
-            with patch.object(master, "make_request", return_value="2"):
-                result = master.get_device_status(1)
-                assert result == "2"
-
-    def test_get_device_name(self):
+    def test_get_device_name(self, master):
         """Test get_device_name method"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock device name request
-            with patch.object(master, "make_request", return_value="TV7105"):
-                result = master.get_device_name(1)
-                assert result == "TV7105"
-
-    def test_get_temperature_celsius_valid(self):
+        with patch.object(master, "make_request", return_value="TV7105"):
+            result = master.get_device_name(1)
+            assert result == "TV7105"
+
+    def test_get_device_name_cached(self, master):
+        """Test that get_device_name only hits the network once per port"""
+        with patch.object(master, "make_request", return_value="TV7105") as mock_rq:
+            assert master.get_device_name(1) == "TV7105"
+            assert master.get_device_name(1) == "TV7105"
+            assert mock_rq.call_count == 1
+
+            # Invalidation forces a fresh fetch
+            master.invalidate_cache()
+            assert master.get_device_name(1) == "TV7105"
+            assert mock_rq.call_count == 2
+
+    def test_get_device_name_failure_not_cached(self, master):
+        """Test that a failed name fetch is retried, not cached as Unknown"""
+        with patch.object(
+            master, "make_request", side_effect=[None, "TV7105"]
+        ) as mock_rq:
+            # Transient failure falls back to Unknown without poisoning
+            # the cache; the next call fetches the real name
+            assert master.get_device_name(1) == "Unknown"
+            assert master.get_device_name(1) == "TV7105"
+            assert mock_rq.call_count == 2
+
+    def test_get_temperature_celsius_valid(self, master):
         """Test temperature conversion with valid data using TV7105 official formula: MeasurementValue * 0.1"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock temperature data (0x0157 = 343 decimal = 343*0.1 = 34.3°C)
-            with patch.object(master, "get_device_data", return_value="0x0157"):
-                result = master.get_temperature_celsius(1)
-                assert round(result, 1) == 34.3
+        # Mock temperature data (0x0157 = 343 decimal = 343*0.1 = 34.3°C)
+        with patch.object(master, "get_device_data", return_value="0x0157"):
+            result = master.get_temperature_celsius(1)
+            assert round(result, 1) == 34.3
 
-    def test_get_temperature_celsius_invalid(self):
+    def test_get_temperature_celsius_invalid(self, master):
         """Test temperature conversion with invalid data"""
-        with patch("requests.get") as mock_get:
-            # Mock successful connection in __init__
-            mock_get.return_value.status_code = 200
-            master = IOLinkMaster("192.168.1.101")
-
-            # Mock invalid temperature data
-            with patch.object(master, "get_device_data", return_value="invalid"):
-                result = master.get_temperature_celsius(1)
-                assert result is None
+        with patch.object(master, "get_device_data", return_value="invalid"):
+            result = master.get_temperature_celsius(1)
+            assert result is None
 
 
 class TestUtilityFunctions:
@@ -175,6 +239,22 @@ class TestUtilityFunctions:
         assert round(hex_to_temperature("0x00FF"), 1) == 25.5  # 255 * 0.1
         assert round(hex_to_temperature("0x0000"), 1) == 0.0  # 0 * 0.1
 
+    def test_hex_to_temperature_negative(self):
+        """Test hex_to_temperature with signed 16-bit values (TV7105 range goes to -53.7°C)"""
+        assert round(hex_to_temperature("0xFE0C"), 1) == -50.0  # -500 * 0.1
+        assert round(hex_to_temperature("0xFFFF"), 1) == -0.1  # -1 * 0.1
+
+    def test_hex_array_to_temperature(self):
+        """Test batch conversion matches the scalar function, including failures"""
+        values = ["0x0157", "0xFE0C", "invalid", "0x0000"]
+        result = hex_array_to_temperature(values)
+        assert [round(t, 1) if t is not None else None for t in result] == [
+            34.3,
+            -50.0,
+            None,
+            0.0,
+        ]
+
     def test_hex_to_temperature_invalid(self):
         """Test hex_to_temperature with invalid input"""
         assert hex_to_temperature("invalid") is None